@@ -1,10 +1,417 @@
-import pandas as pd
-import json
-import yaml
+from __future__ import annotations
+
+import io
 import argparse
+import json
+import ast
+import codecs
+import dataclasses
+import datetime
+import functools
+import math
 import os
+import re
+import sys
 import glob
-from typing import Tuple, List, Dict, Union, Any
+import string
+import importlib.util
+from typing import Tuple, List, Dict, Union, Any, IO, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pandas, numpy and yaml are imported where they are used, not at startup
+    import numpy as np
+    import pandas as pd
+    import yaml
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used instead
+    orjson = None
+
+
+def _represent_datetime(dumper: yaml.SafeDumper, value: datetime.date) -> yaml.Node:
+    if value != value:  # pandas.NaT
+        return dumper.represent_none(None)
+    if isinstance(value, datetime.datetime):
+        return dumper.represent_datetime(value)
+    return dumper.represent_date(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Tuple[Any, type, type]:
+    """Import PyYAML on first use; returns (yaml, dumper class, loader class)."""
+    import yaml
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper, SafeLoader
+
+    class YamlDumper(SafeDumper):
+        """libyaml safe dumper that also accepts datetime subclasses such as pandas.Timestamp."""
+
+    YamlDumper.add_multi_representer(datetime.date, _represent_datetime)
+    return yaml, YamlDumper, SafeLoader
+
+
+# Strings PyYAML would load back as plain str; anything else gets double-quoted.
+_YAML_PLAIN_STR = re.compile(r'[A-Za-z_][A-Za-z0-9_.\-/]*(?: [A-Za-z0-9_.\-/]+)*')
+_YAML_RESERVED = frozenset(('y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null'))
+# Characters JSON leaves raw that YAML rejects or treats as line breaks.
+_YAML_UNSAFE_CHARS = re.compile('[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]')
+_YAML_SCALAR_TYPES = (str, int, float, type(None))
+
+
+def _yaml_scalar(value: Union[str, int, float, bool, None]) -> str:
+    """Render a scalar the way yaml.dump would, without going through the representer."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return '.nan'
+        if math.isinf(value):
+            return '.inf' if value > 0 else '-.inf'
+        text = float.__repr__(value)
+        return text.replace('e', '.0e', 1) if '.' not in text and 'e' in text else text
+    if _YAML_PLAIN_STR.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    quoted = json.dumps(value, ensure_ascii=False)  # JSON strings are valid YAML double-quoted scalars
+    return _YAML_UNSAFE_CHARS.sub(lambda m: f'\\u{ord(m.group()):04x}', quoted)
+
+
+def _is_flat_records(obj: Any) -> bool:
+    """True for a list of dicts with str keys and scalar values (what to_dict('records') yields)."""
+    return isinstance(obj, list) and all(
+        isinstance(record, dict) and all(
+            isinstance(key, str) and isinstance(value, _YAML_SCALAR_TYPES)
+            for key, value in record.items())
+        for record in obj)
+
+
+def _fast_yaml_records(records: List[Dict[str, Any]], fp: IO[str]) -> None:
+    """Write flat records as block-style YAML, equivalent to yaml.dump(records, default_flow_style=False)."""
+    if not records:
+        fp.write('[]\n')
+        return
+    for record in records:
+        if not record:
+            fp.write('- {}\n')
+            continue
+        prefix = '- '
+        for key in sorted(record):
+            fp.write(f'{prefix}{_yaml_scalar(key)}: {_yaml_scalar(record[key])}\n')
+            prefix = '  '
+
+
+def _query_engine(df: pd.DataFrame) -> Union[str, None]:
+    """numexpr cannot evaluate extension (e.g. Arrow-backed) columns; leave pandas' default otherwise."""
+    import pandas as pd
+    return 'python' if any(isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                           for dtype in df.dtypes) else None
+
+
+def _records(data: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a frame to a list of row dicts."""
+    return data.to_dict(orient='records')
+
+
+# python-calamine backs pandas' Rust "calamine" engine (pandas >= 2.2).
+CALAMINE_AVAILABLE: bool = importlib.util.find_spec('python_calamine') is not None
+CALAMINE_EXTENSIONS: Tuple[str, ...] = ('.xlsx', '.xlsm', '.xlsb', '.xls', '.ods')
+OPENPYXL_EXTENSIONS: Tuple[str, ...] = ('.xlsx', '.xlsm')
+COMPILED_WHERE_MAX_ROWS: int = 50_000  # above this, DataFrame.eval (numexpr) is faster
+FORMAT_SNIFF_BYTES: int = 4096  # detect_file_format only looks at the first line, up to this size
+
+
+def _excel_engine(input_file: str) -> Union[str, None]:
+    """Pick the fastest available read_excel engine for the input file extension."""
+    extension = os.path.splitext(input_file)[1].lower()
+    if CALAMINE_AVAILABLE and extension in CALAMINE_EXTENSIONS:
+        return 'calamine'
+    if extension in OPENPYXL_EXTENSIONS:
+        return 'openpyxl'  # pandas opens the workbook read_only/data_only
+    return None
+
+
+# Node types a where clause may use to be compiled into a direct Series expression; anything
+# else (pandas' own '&'/'|' precedence, '@' locals, functions) is left to DataFrame.eval.
+_WHERE_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.UAdd,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.FloorDiv,
+    ast.Name, ast.Load, ast.Constant, ast.List, ast.Tuple,
+)
+
+
+class _VectorizeWhere(ast.NodeTransformer):
+    """Rewrite query-style boolean logic into element-wise operators on Series."""
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        return functools.reduce(lambda left, right: ast.BinOp(left, op, right), node.values)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        return ast.UnaryOp(ast.Invert(), node.operand) if isinstance(node.op, ast.Not) else node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        parts, left = [], node.left
+        for op, right in zip(node.ops, node.comparators):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                part = ast.Call(ast.Attribute(left, 'isin', ast.Load()), [right], [])
+                parts.append(ast.UnaryOp(ast.Invert(), part) if isinstance(op, ast.NotIn) else part)
+            else:
+                parts.append(ast.Compare(left, [op], [right]))
+            left = right
+        return functools.reduce(lambda a, b: ast.BinOp(a, ast.BitAnd(), b), parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_where(where_clause: str) -> Tuple[Union[Any, None], Union[frozenset, None]]:
+    """
+    Parse a where clause once: returns (code, names). code evaluates to a boolean Series given
+    the referenced columns, or is None when the clause must go through DataFrame.eval; names is
+    None when the clause is not a Python expression at all (backticks, '@' locals).
+    """
+    try:
+        tree = ast.parse(where_clause, mode='eval')
+    except SyntaxError:
+        return None, None
+    names = frozenset(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+    for node in ast.walk(tree):
+        if not isinstance(node, _WHERE_NODES):
+            return None, names
+        if isinstance(node, ast.Compare) and any(
+                isinstance(op, (ast.In, ast.NotIn)) for op in node.ops) and (
+                not isinstance(node.left, ast.Name)
+                or not all(isinstance(c, (ast.List, ast.Tuple)) for c in node.comparators)):
+            return None, names  # only "column in [...]" maps onto Series.isin
+    tree = ast.fix_missing_locations(_VectorizeWhere().visit(tree))
+    return compile(tree, '<where>', 'eval'), names
+
+
+def _where_mask(df: pd.DataFrame, where_clause: str) -> np.ndarray:
+    """
+    Evaluate a where clause into a boolean row mask. Small frames reuse the compiled form,
+    which skips DataFrame.eval's per-call parsing; from COMPILED_WHERE_MAX_ROWS rows on,
+    numexpr evaluates faster than the chain of Series operations. The compiled form only runs
+    on NumPy columns, where it agrees with DataFrame.eval on missing values; extension
+    (nullable, Arrow) columns keep eval's NA handling.
+    """
+    import pandas as pd
+    code, names = _compile_where(where_clause)
+    if (code is not None and len(df) < COMPILED_WHERE_MAX_ROWS and names <= set(df.columns)
+            and not any(isinstance(df[name].dtype, pd.api.extensions.ExtensionDtype) for name in names)):
+        result = eval(code, {'__builtins__': {}}, {name: df[name] for name in names})
+        if isinstance(result, pd.Series) and pd.api.types.is_bool_dtype(result.dtype):
+            return result.to_numpy(dtype=bool, na_value=False)
+    mask = df.eval(where_clause, engine=_query_engine(df))
+    return mask.to_numpy(dtype=bool, na_value=False)
+
+
+def _referenced_columns(select_columns: Union[str, None],
+                        where_clause: Union[str, None]) -> Union[set, None]:
+    """Collect the column names used by select_columns and where_clause, or None for all."""
+    if not select_columns:
+        return None
+    columns = set(select_columns.split(","))
+    if where_clause:
+        names = _compile_where(where_clause)[1]
+        if names is None:
+            return None  # backtick-quoted or '@' names: let the reader load everything
+        columns.update(names)
+    return columns
+
+
+def _filter_frame(df: pd.DataFrame, select_columns: Union[str, None],
+                  where_clause: Union[str, None]) -> pd.DataFrame:
+    """Apply a where clause and a column selection to an already loaded frame."""
+    if where_clause:
+        df = df.loc[_where_mask(df, where_clause)]
+    return df[select_columns.split(",")] if select_columns else df
+
+
+@dataclasses.dataclass(frozen=True)
+class _Plan:
+    """What to read from a workbook and which rows/columns to keep, recorded before any I/O."""
+    input_file: str
+    header_keyword: str
+    start_table: int = 0
+    end_table: Union[int, None] = None
+    select_columns: Union[str, None] = None
+    where_clause: Union[str, None] = None
+
+    def with_filter(self, select_columns: Union[str, None], where_clause: Union[str, None]) -> '_Plan':
+        """Narrow the plan; where clauses are and-ed, a new selection replaces the old one."""
+        if where_clause and self.where_clause and where_clause != self.where_clause:
+            where_clause = f"({self.where_clause}) and ({where_clause})"
+        return dataclasses.replace(self, select_columns=select_columns or self.select_columns,
+                                   where_clause=where_clause or self.where_clause)
+
+    def execute(self) -> pd.DataFrame:
+        """Read the sheet with projection/predicate pushdown and split it into its tables."""
+        try:
+            mtime_ns = os.stat(self.input_file).st_mtime_ns
+            columns = _referenced_columns(self.select_columns, self.where_clause)
+            usecols = None
+            # calamine parses every column regardless, and peeking at the header row would
+            # parse the sheet twice; the selection is then applied after the read.
+            if columns is not None and _excel_engine(self.input_file) != 'calamine':
+                # Column 0 is always kept: it carries the header keyword.
+                usecols = tuple(i for i, name in enumerate(_sheet_columns(self.input_file, mtime_ns))
+                                if i == 0 or name in columns)
+        except Exception as e:
+            raise ValueError(f"Failed to load Excel file: {e}")
+
+        df = _load_excel_impl(self.input_file, mtime_ns, self.header_keyword,
+                              self.start_table, self.end_table, usecols)
+        # _filter_frame/reset_index always hand back a new frame; the cached one stays untouched.
+        return _filter_frame(df, self.select_columns, self.where_clause).reset_index(drop=True)
+
+
+def _row_window(input_file: str, header_keyword: str, start: int,
+                end: Union[int, None]) -> Union[Tuple[int, Union[int, None], int], None]:
+    """
+    Locate the rows start:end by scanning only column A (openpyxl, read_only).
+    Returns (first_row, nrows, local_start): the sheet is read from the header row opening
+    the table of row start, and local_start data rows of that table precede it.
+    None when the window cannot be computed cheaply, meaning the whole sheet is read.
+    """
+    if (not isinstance(end, int) or not isinstance(start, int) or start < 0 or end <= start
+            or os.path.splitext(input_file)[1].lower() not in OPENPYXL_EXTENSIONS):
+        return None
+
+    import openpyxl
+    workbook = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        # Row 1 holds the column names, so index i is DataFrame row i.
+        column_a = workbook.worksheets[0].iter_rows(min_row=2, max_col=1, values_only=True)
+        data_seen, last_header, first_row, local_start = 0, None, None, 0
+        for i, row in enumerate(column_a):
+            if row and row[0] == header_keyword:
+                last_header = i
+                continue
+            if last_header is None:
+                continue
+            if data_seen == start:
+                first_row, local_start = last_header, i - last_header - 1
+            data_seen += 1
+            if data_seen == end:
+                return first_row, i - first_row + 1, local_start
+    finally:
+        workbook.close()
+    return None if first_row is None else (first_row, None, local_start)
+
+
+@functools.lru_cache(maxsize=8)
+def _sheet_columns(input_file: str, mtime_ns: int) -> Tuple[Any, ...]:
+    """Column names of the first sheet (header row only); cached per file version."""
+    import pandas as pd
+    engine = _excel_engine(input_file)
+    return tuple(pd.read_excel(input_file, sheet_name=0, engine=engine, nrows=0).columns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_excel_impl(input_file: str, mtime_ns: int, header_keyword: str, start_table: int,
+                     end_table: Union[int, None], usecols: Union[Tuple[int, ...], None]) -> pd.DataFrame:
+    """
+    Read and split the tables of a sheet. Memoized per file version (mtime_ns) and load
+    parameters, so batches querying one workbook parse it once; treat the result as read-only.
+    """
+    import numpy as np
+    import pandas as pd
+    engine = _excel_engine(input_file)
+    # Cells keep the reader's values (dtype=object): inferring dtypes per read would make
+    # them depend on which rows a windowed read happens to cover.
+    options = dict(sheet_name=0, engine=engine, dtype=object,
+                   usecols=list(usecols) if usecols is not None else None)
+    start, end = start_table, end_table
+    try:
+        df = None
+        # calamine parses the whole sheet faster than openpyxl can stream column A alone.
+        window = (_row_window(input_file, header_keyword, start_table, end_table)
+                  if engine != 'calamine' else None)
+        if window is not None:
+            first_row, nrows, start = window
+            df = pd.read_excel(input_file, skiprows=range(1, first_row + 1),  # keep the column-name row
+                               nrows=nrows, **options)
+            end = start + (end_table - start_table)
+            if nrows is not None and len(df) < nrows:
+                # Blank rows closing the window were trimmed, but are rows mid-sheet: read it all.
+                df, start, end = None, start_table, end_table
+        if df is None:
+            df = pd.read_excel(input_file, **options)
+    except Exception as e:
+        raise ValueError(f"Failed to load Excel file: {e}")
+
+    header_mask = (df.iloc[:, 0] == header_keyword).to_numpy()
+    header_rows = np.flatnonzero(header_mask)
+    if not len(header_rows):
+        raise ValueError(f"No '{header_keyword}' headers found in {input_file}")
+
+    # Rows before the first header belong to no table; every other non-header
+    # row inherits the value of the header row that opens its table. isetitem swaps the
+    # column out in one write instead of setting values through a possible view.
+    table_ids = header_mask.cumsum()
+    df.isetitem(0, df.iloc[:, 0].where(header_mask).ffill())
+
+    if len(header_rows) == 1:
+        # A single table (the common case) is a positional slice: no fancy-index copy.
+        df = df.iloc[header_rows[0] + 1:].iloc[start:end]
+    else:
+        df = df.iloc[np.flatnonzero(~header_mask & (table_ids > 0))[start:end]]
+    return df
+
+
+class DeferredFrame:
+    """
+    Lazy stand-in for the loaded DataFrame: filters extend the plan, and the workbook is
+    read the first time data is needed (collect(), or any DataFrame attribute access).
+    """
+
+    def __init__(self, plan: _Plan):
+        self.plan = plan
+        self._frame: Union[pd.DataFrame, None] = None
+
+    @property
+    def collected(self) -> bool:
+        return self._frame is not None
+
+    def collect(self) -> pd.DataFrame:
+        """Execute the plan once and return the materialized frame."""
+        if self._frame is None:
+            self._frame = self.plan.execute()
+        return self._frame
+
+    def filter(self, select_columns: Union[str, None],
+               where_clause: Union[str, None]) -> Union[pd.DataFrame, 'DeferredFrame']:
+        """Push a selection/where clause into the plan, or apply it directly once loaded."""
+        if not self.collected:
+            return DeferredFrame(self.plan.with_filter(select_columns, where_clause))
+        if where_clause == self.plan.where_clause:
+            where_clause = None  # already applied while loading
+        return _filter_frame(self._frame, select_columns, where_clause)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.collect(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.collect()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.collect())
+
+    def __len__(self) -> int:
+        return len(self.collect())
+
+    def __repr__(self) -> str:
+        return repr(self.collect())
 
 
 class ExcelDataTransformer:
@@ -14,13 +421,17 @@ class ExcelDataTransformer:
         Parsing information like 'HEADER_KEYWORD_TEXT' and data structure will be configured later.
         """
         self.input_file: Union[str, None] = input_file
-        self.df: Union[pd.DataFrame, None] = None
+        self.df: Union[pd.DataFrame, DeferredFrame, None] = None
         self.header_keyword: Union[str, None] = None
         self.start_table: int = 0
         self.end_table: Union[int, None] = None
         self.data_structure: Dict[str, Any] = {'DATA_GROUP_COLLECTION': {}}  # Default structure
         self.base_report_path: Union[str, None] = None
         self.filename_pattern: Union[str, None] = None
+        self.select_columns: Union[str, None] = None
+        self.where_clause: Union[str, None] = None
+        self._filename_parts: Union[List[Tuple[str, Union[str, None]]], None] = None
+        self._reset_file_caches()
 
     def configure(self, **config: Dict[str, Any]) -> None:
         """
@@ -33,15 +444,45 @@ class ExcelDataTransformer:
         self.base_report_path = config.get('base_report_path', None)
         self.filename_pattern = config.get('filename_pattern', None)
         self.data_structure = config.get('data_structure', {'DATA_GROUP_COLLECTION': {}})
+        self.select_columns = config.get('select_columns', None)
+        self.where_clause = config.get('where_clause', None)
+        self._filename_parts = self._split_filename_pattern()
+        self._reset_file_caches()
+
+    def _reset_file_caches(self) -> None:
+        """Drop cached file lookups; they depend on base_report_path and filename_pattern."""
+        self._find_cached = functools.lru_cache(maxsize=1024)(self._find_matches)
+
+    def _split_filename_pattern(self) -> Union[List[Tuple[str, Union[str, None]]], None]:
+        """Pre-parse filename_pattern into (literal, field) pairs, or None if str.format is needed."""
+        if not self.filename_pattern:
+            return None
+        parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(self.filename_pattern):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                return None
+            parts.append((literal, field))
+        return parts
+
+    def _format_filename(self, **fields: str) -> str:
+        """Fill filename_pattern using the pre-parsed parts."""
+        if self._filename_parts is None:
+            return self.filename_pattern.format(**fields)
+        return ''.join(literal + (str(fields[field]) if field is not None else '')
+                       for literal, field in self._filename_parts)
+
+    def _find_matches(self, data_group: str, category: str) -> Tuple[str, Tuple[str, ...]]:
+        """Resolve the glob pattern for a (data_group, category) pair; cached per configuration."""
+        pattern = os.path.join(self.base_report_path, self._format_filename(
+            data_group=data_group, category=category))
+        return pattern, tuple(glob.glob(pattern))
 
     def find_xlsx_file(self, data_group: str, category: str) -> str:
         """Find XLSX file using a configurable path pattern."""
         if not self.base_report_path or not self.filename_pattern:
             raise ValueError("Base report path or filename pattern is not configured.")
 
-        pattern = os.path.join(self.base_report_path, self.filename_pattern.format(
-            data_group=data_group, category=category))
-        matches = glob.glob(pattern)
+        pattern, matches = self._find_cached(data_group, category)
 
         if not matches:
             raise FileNotFoundError(f"No files found matching {pattern}")
@@ -49,42 +490,58 @@ class ExcelDataTransformer:
             raise ValueError(f"Multiple files found for {pattern}")
         return matches[0]
 
-    def _load_excel(self) -> pd.DataFrame:
-        """Load Excel file and validate structure based on configuration."""
-        try:
-            df = pd.read_excel(self.input_file, sheet_name=0)
-        except Exception as e:
-            raise ValueError(f"Failed to load Excel file: {e}")
-
-        process_rows = df[df.iloc[:, 0] == self.header_keyword].index.tolist()
-        if not process_rows:
-            raise ValueError(f"No '{self.header_keyword}' headers found in {self.input_file}")
-
-        tables = [
-            df.iloc[process_rows[i] + 1: process_rows[i + 1]
-                    if i + 1 < len(process_rows) else len(df)]
-            .reset_index(drop=True)
-            .assign(**{df.columns[0]: df.iloc[process_rows[i]]})
-            for i in range(len(process_rows))
-        ]
-
-        self.df = pd.concat(tables, ignore_index=True).iloc[self.start_table:self.end_table]
+    def _load_excel(self, where_clause: Union[str, None] = None) -> 'DeferredFrame':
+        """
+        Record how to load the Excel file based on configuration; nothing is read yet.
+        A where clause (argument or configured) is pushed into the read as well.
+        """
+        self.df = DeferredFrame(_Plan(
+            input_file=self.input_file, header_keyword=self.header_keyword,
+            start_table=self.start_table, end_table=self.end_table,
+            select_columns=self.select_columns, where_clause=where_clause or self.where_clause))
         return self.df
 
-    def filter_data(self, select_columns: Union[str, None], 
+    def filter_data(self, select_columns: Union[str, None],
                     where_clause: Union[str, None]) -> pd.DataFrame:
         """Filter data by selected columns and optional where clause."""
-        filtered_df = self.df if not where_clause else self.df.query(where_clause)
-        return filtered_df[select_columns.split(",")] if select_columns else filtered_df
+        if isinstance(self.df, DeferredFrame):
+            data = self.df.filter(select_columns, where_clause)
+            return data.collect() if isinstance(data, DeferredFrame) else data
+        return _filter_frame(self.df, select_columns, where_clause)
 
     def output_data(self, data: pd.DataFrame, output_format: str) -> Union[str, List[Dict[str, Any]]]:
-        """Format filtered data as JSON, YAML, or CSV."""
+        """Format filtered data as JSON, JSON Lines, YAML, or CSV."""
+        buffer = io.StringIO()
+        self.output_data_to(data, buffer, output_format)
+        return buffer.getvalue()
+
+    def output_data_to(self, data: Union[pd.DataFrame, 'DeferredFrame', List[Dict[str, Any]]],
+                       fp: IO[str], output_format: str) -> None:
+        """
+        Write filtered data as JSON, JSON Lines, YAML, or CSV straight to an open text stream.
+        data may also be the records already built for the output file, so they are built once.
+        """
+        if isinstance(data, DeferredFrame):
+            data = data.collect()
+        if output_format == 'csv':
+            if isinstance(data, list):
+                import pandas as pd
+                data = pd.DataFrame.from_records(data)
+            data.to_csv(fp, index=False)
+            return
+        records = _output_records(data)
         if output_format == 'json':
-            return json.dumps(data.to_dict(orient='records'), indent=2)
+            # Same encoder as the output files, so printed and stored values agree.
+            _write_encoded(fp, _json_bytes(records, indent=True) + b'\n')
+        elif output_format == 'jsonl':
+            for record in records:
+                _write_encoded(fp, _json_bytes(record) + b'\n')
         elif output_format == 'yaml':
-            return yaml.dump(data.to_dict(orient='records'), default_flow_style=False)
-        elif output_format == 'csv':
-            return data.to_csv(index=False)
+            if _is_flat_records(records):
+                _fast_yaml_records(records, fp)
+            else:
+                yaml, dumper, _ = _yaml()
+                yaml.dump(records, fp, Dumper=dumper, default_flow_style=False)
         else:
             raise ValueError(f"Unsupported format: {output_format}")
 
@@ -100,52 +557,256 @@ class ExcelDataTransformer:
 
 def detect_file_format(file_path: str) -> str:
     """Detect the format of the existing file (JSON, YAML, or CSV)."""
-    with open(file_path, 'r') as f:
-        first_line = f.readline().strip()
+    stat = os.stat(file_path)
+    return _sniff_file_format(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _sniff_file_format(file_path: str, mtime_ns: int, size: int) -> str:
+    """Classify a file by its first line; cached per (path, mtime, size), so rewrites re-sniff."""
+    with open(file_path, 'rb') as f:
+        head = f.read(FORMAT_SNIFF_BYTES)
+    if head.startswith(b'\xef\xbb\xbf'):
+        head = head[3:]
+    first_line = head.lstrip().split(b'\n', 1)[0].strip()
 
     if not first_line:
         raise ValueError(f"File {file_path} is empty or corrupted")
 
-    if first_line.startswith('{'):
+    if first_line[:1] in (b'{', b'['):
         return 'json'
-    elif first_line.startswith('---'):
+    elif first_line.startswith((b'---', b'%YAML')):
         return 'yaml'
-    elif ',' in first_line or first_line.lower().startswith('sep='):
+    elif b',' in first_line or first_line.lower().startswith(b'sep='):
         return 'csv'
     else:
         raise ValueError("Unknown file format")
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize values json/orjson do not handle natively (timestamps, numpy scalars)."""
+    if hasattr(obj, 'isoformat'):
+        if obj != obj:  # pandas.NaT
+            return None
+        return obj.isoformat()
+    if hasattr(obj, 'item'):
+        return _finite_or_none(obj.item())
+    return str(obj)
+
+
+def _finite_or_none(obj: Any) -> Any:
+    """Replace NaN/inf floats with None, as orjson encodes them, for the stdlib json fallback."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def _json_bytes(content: Any, indent: bool = False) -> bytes:
+    """Encode content as UTF-8 JSON (two-space indented, or on one line) with orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(content, default=_json_default,
+                            option=(option | orjson.OPT_INDENT_2) if indent else option)
+    return json.dumps(_finite_or_none(content), indent=2 if indent else None,
+                      separators=None if indent else (',', ':'), ensure_ascii=False,
+                      default=_json_default).encode()
+
+
+def _write_encoded(fp: IO[str], payload: bytes) -> None:
+    """Write UTF-8 output to a text stream, straight to its binary buffer when it is UTF-8 too."""
+    buffer = getattr(fp, 'buffer', None)
+    encoding = getattr(fp, 'encoding', None)
+    if buffer is not None and encoding and codecs.lookup(encoding).name == 'utf-8':
+        fp.flush()
+        buffer.write(payload)
+    else:
+        fp.write(payload.decode())
+
+
+def write_json_file(output_file: str, content: Any) -> None:
+    """Serialize content to output_file, using orjson's native encoder when available."""
+    with open(output_file, 'wb') as f:
+        f.write(_json_bytes(content, indent=True))
+
+
+def append_jsonl_record(output_file: str, record: Dict[str, Any]) -> None:
+    """Append one record as a JSON Lines entry; nothing already written is touched."""
+    with open(output_file, 'ab') as f:
+        f.write(_json_bytes(record) + b'\n')
+
+
+def _output_records(data: Any) -> Any:
+    """Turn a (deferred) frame into the list of row dicts stored in output files."""
+    import pandas as pd
+    if isinstance(data, DeferredFrame):
+        data = data.collect()
+    return _records(data) if isinstance(data, pd.DataFrame) else data
+
+
+def _collection_key(parser: ExcelDataTransformer) -> str:
+    """Top-level key of output files: data_structure['DATA_GROUP_COLLECTION'] when it names one."""
+    name = parser.data_structure.get('DATA_GROUP_COLLECTION')
+    return name if isinstance(name, str) and name else 'DATA_GROUP_COLLECTION'
+
+
+def read_output_content(output_file: str, output_format: str) -> Dict[str, Any]:
+    """Load an existing JSON/YAML output file of the given (detected) format."""
+    if output_format == 'csv':
+        raise ValueError("Cannot update CSV files incrementally")
+
+    try:
+        # JSON output is always written as UTF-8, whatever the locale.
+        with open(output_file, 'r', encoding='utf-8' if output_format == 'json' else None) as f:
+            if output_format == 'json':
+                content = json.load(f)
+            else:
+                yaml, _, loader = _yaml()
+                content = yaml.load(f, Loader=loader)
+    except Exception as e:
+        raise ValueError(f"Error reading or parsing {output_file}: {e}")
+    if not isinstance(content, dict):
+        raise ValueError(f"Error reading or parsing {output_file}: expected a mapping at the top "
+                         f"level, found {type(content).__name__}")
+    return content
+
+
+def merge_output_content(content: Dict[str, Any], collection: str, data_group: str,
+                         category: str, data: Any) -> bool:
+    """Set content[collection][data_group][category] = data; returns False if it was already so."""
+    group = content.setdefault(collection, {}).setdefault(data_group, {})
+    if category in group and group[category] == data:
+        return False
+    group[category] = data
+    return True
+
+
+def write_output_content(output_file: str, content: Any, output_format: str) -> None:
+    """Rewrite a JSON/YAML output file with the given content."""
+    if output_format == 'json':
+        write_json_file(output_file, content)
+    elif output_format == 'yaml':
+        yaml, dumper, _ = _yaml()
+        with open(output_file, 'w') as f:
+            # '---' marks the file as YAML for detect_file_format on the next update.
+            yaml.dump(content, f, Dumper=dumper, default_flow_style=False, explicit_start=True)
+
+
 def update_output_file(output_file: str, data: Any, parser: ExcelDataTransformer, 
-                       data_group: str, category: str) -> None:
-    """Update or insert data in output file (JSON/YAML)."""
+                       data_group: str, category: str) -> Union[str, None]:
+    """
+    Update or insert data in output file (JSON/YAML) and return the format written.
+    '.jsonl' files are appended to instead of rewritten.
+    """
+    data = _output_records(data)
+
+    if output_file.endswith('.jsonl'):
+        append_jsonl_record(output_file, {'data_group': data_group, 'category': category, 'data': data})
+        return 'jsonl'
+
     if os.path.exists(output_file):
         try:
             output_format = detect_file_format(output_file)
         except ValueError as e:
             print(f"Error detecting file format: {e}")
-            return
+            return None
+        content = read_output_content(output_file, output_format)
+    else:
+        content, output_format = {}, 'json'
 
-        if output_format == 'csv':
-            raise ValueError("Cannot update CSV files incrementally")
+    if merge_output_content(content, _collection_key(parser), data_group, category, data):
+        write_output_content(output_file, content, output_format)
+    return output_format
 
-        try:
-            with open(output_file, 'r') as f:
-                content = json.loads(f.read()) if output_format == 'json' else yaml.safe_load(f)
 
-            content.setdefault(parser.data_structure['DATA_GROUP_COLLECTION'], {}).setdefault(
-                data_group, {})[category] = data
-        except Exception as e:
-            raise ValueError(f"Error reading or parsing {output_file}: {e}")
-    else:
-        content = {parser.data_structure: {data_group: {category: data}}}
-        output_format = 'json'
+def read_batch_manifest(manifest_file: str) -> List[Dict[str, Union[str, None]]]:
+    """
+    Read batch entries (data_group, category, select, where) from a JSON list of objects
+    or a CSV file with those column names. Empty select/where values mean "not set".
+    """
+    with open(manifest_file, 'r', newline='') as f:
+        if manifest_file.lower().endswith('.json'):
+            rows = json.load(f)
+        else:
+            import csv
+            rows = list(csv.DictReader(f))
+    return [{key: (row.get(key) or None) for key in ('data_group', 'category', 'select', 'where')}
+            for row in rows]
+
+
+def process_batch(manifest_file: str, output_file: str, parser: ExcelDataTransformer,
+                  input_file: Union[str, None] = None) -> Union[int, None]:
+    """
+    Process every manifest entry in one run and return how many were written. Workbooks shared
+    by several entries are read once; JSON/YAML output is read and rewritten a single time.
+    Returns None, like update_output_file, when the output file's format cannot be detected.
+    """
+    # Check the output file before any workbook is read, so a bad one costs nothing.
+    content = output_format = None
+    if not output_file.endswith('.jsonl'):
+        if os.path.exists(output_file):
+            try:
+                output_format = detect_file_format(output_file)
+            except ValueError as e:
+                print(f"Error detecting file format: {e}")
+                return None
+            content = read_output_content(output_file, output_format)
+        else:
+            content, output_format = {}, 'json'
 
-    with open(output_file, 'w') as f:
-        if output_format == 'json':
-            json.dump(content, f, indent=2)
-        elif output_format == 'yaml':
-            yaml.dump(content, f, default_flow_style=False)
+    entries = read_batch_manifest(manifest_file)
+    resolved = []
+    for entry in entries:
+        try:
+            resolved.append((entry, input_file or parser.find_xlsx_file(entry['data_group'],
+                                                                        entry['category'])))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error ({entry['data_group']}/{entry['category']}): {e}")
+    uses = {}
+    for _, path in resolved:
+        uses[path] = uses.get(path, 0) + 1
+
+    shared: Dict[str, DeferredFrame] = {}
+    results = []
+    saved = parser.input_file, parser.select_columns, parser.where_clause, parser.df
+    try:
+        for entry, path in resolved:
+            parser.input_file = path
+            try:
+                if uses[path] > 1:
+                    # Load every column once; each entry then filters the collected frame.
+                    if path not in shared:
+                        parser.select_columns = parser.where_clause = None
+                        shared[path] = parser._load_excel()
+                        shared[path].collect()
+                    data = shared[path].filter(entry['select'], entry['where'])
+                else:
+                    parser.select_columns, parser.where_clause = entry['select'], entry['where']
+                    data = parser._load_excel()
+                results.append((entry, _output_records(data)))
+            except Exception as e:
+                print(f"Error ({entry['data_group']}/{entry['category']}): {e}")
+    finally:
+        parser.input_file, parser.select_columns, parser.where_clause, parser.df = saved
+
+    if output_file.endswith('.jsonl'):
+        for entry, data in results:
+            append_jsonl_record(output_file, {'data_group': entry['data_group'],
+                                              'category': entry['category'], 'data': data})
+        return len(results)
+
+    # Later entries for the same (data_group, category) win, as with one update per entry.
+    latest = {(entry['data_group'], entry['category']): data for entry, data in results}
+    collection = _collection_key(parser)
+    changed = False
+    for (data_group, category), data in latest.items():
+        changed |= merge_output_content(content, collection, data_group, category, data)
+    if changed:
+        write_output_content(output_file, content, output_format)
+    return len(results)
 
 
 def create_argparser() -> argparse.ArgumentParser:
@@ -161,6 +822,8 @@ def create_argparser() -> argparse.ArgumentParser:
     parser.add_argument('--where', help="Filter condition, e.g., 'DOG == \"DOG_t\" and SIZE == 25' (optional)")
     parser.add_argument('--output', help="Output file to update/insert content")
     parser.add_argument('--show_headers', action='store_true', help="Print headers only")
+    parser.add_argument('--batch', help="CSV/JSON manifest of data_group,category,select,where entries "
+                                        "to process in one run (requires --output)")
 
     return parser
 
@@ -174,12 +837,27 @@ def main() -> None:
         'start_table': 0,
         'end_table': None,
         'base_report_path': args.base_report_path,
+        'select_columns': None if args.show_headers else args.select,
+        'where_clause': None if args.show_headers else args.where,
         'filename_pattern': "project/xml_data/{data_group}/{category}/report/{category}_*_meas.xlsx"
     }
 
     parser = ExcelDataTransformer()
     parser.configure(**config)
 
+    if args.batch:
+        if not args.output:
+            print("Error: --output is required with --batch.")
+            return
+        try:
+            count = process_batch(args.batch, args.output, parser, input_file=args.input)
+        except Exception as e:
+            print(f"Error: {e}")
+            return
+        if count is not None:
+            print(f"Wrote {count} entries to {args.output}")
+        return
+
     try:
         input_file = args.input or parser.find_xlsx_file(args.data_group, args.category)
     except (FileNotFoundError, ValueError) as e:
@@ -189,7 +867,8 @@ def main() -> None:
     parser.input_file = input_file
 
     try:
-        parser._load_excel()
+        # The configured select/where are pushed into this read, so load errors surface here.
+        parser._load_excel().collect()
     except Exception as e:
         print(f"Error loading Excel file: {e}")
         return
@@ -204,10 +883,12 @@ def main() -> None:
 
     try:
         filtered_data = parser.filter_data(select_columns=args.select, where_clause=args.where)
-        update_output_file(args.output, filtered_data, parser, args.data_group, args.category)
-
-        output_format = detect_file_format(args.output) if os.path.exists(args.output) else 'json'
-        print(parser.output_data(filtered_data, output_format))
+        records = _output_records(filtered_data)  # shared by the output file and stdout
+        output_format = update_output_file(args.output, records, parser,
+                                           args.data_group, args.category)
+        if output_format is None:
+            return
+        parser.output_data_to(records, sys.stdout, output_format)
 
     except Exception as e:
         print(f"Error: {e}")
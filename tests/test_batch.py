@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import ExcelDataTransformer as edt
+
+openpyxl = pytest.importorskip('openpyxl')
+
+KEYWORD = 'HEADER_KEYWORD_TEXT'
+PATTERN = 'project/{data_group}/{category}/{category}_*_meas.xlsx'
+
+
+def _workbook(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook = openpyxl.Workbook()
+    for row in [['ID', 'NAME', 'SIZE'], [KEYWORD, 'NAME', 'SIZE']] + rows:
+        workbook.active.append(row)
+    workbook.save(path)
+
+
+@pytest.fixture
+def parser(tmp_path):
+    _workbook(tmp_path / 'project/g1/c1/c1_a_meas.xlsx', [['x', 'alpha', 25], ['y', 'beta', 5]])
+    _workbook(tmp_path / 'project/g2/c1/c1_b_meas.xlsx', [['z', 'gamma', 40]])
+    parser = edt.ExcelDataTransformer()
+    parser.configure(header_keyword=KEYWORD, base_report_path=str(tmp_path), filename_pattern=PATTERN)
+    return parser
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    path = tmp_path / 'manifest.csv'
+    path.write_text('data_group,category,select,where\n'
+                    'g1,c1,NAME,SIZE > 10\n'
+                    'g1,c1,"NAME,SIZE",\n'
+                    'g2,c1,,\n'
+                    'g9,c1,,\n')
+    return path
+
+
+def test_read_batch_manifest_csv_and_json(tmp_path, manifest):
+    entries = edt.read_batch_manifest(str(manifest))
+    assert entries[0] == {'data_group': 'g1', 'category': 'c1', 'select': 'NAME', 'where': 'SIZE > 10'}
+    assert entries[1]['where'] is None and entries[2]['select'] is None
+    json_manifest = tmp_path / 'manifest.json'
+    json_manifest.write_text(json.dumps([{'data_group': 'g1', 'category': 'c1', 'select': ''}]))
+    assert edt.read_batch_manifest(str(json_manifest)) == [
+        {'data_group': 'g1', 'category': 'c1', 'select': None, 'where': None}]
+
+
+def test_process_batch_writes_every_entry_once(tmp_path, parser, manifest, capsys):
+    output = tmp_path / 'out.json'
+    saved = parser.input_file, parser.select_columns, parser.where_clause, parser.df
+    assert edt.process_batch(str(manifest), str(output), parser) == 3
+    assert 'g9/c1' in capsys.readouterr().out
+    assert (parser.input_file, parser.select_columns, parser.where_clause, parser.df) == saved
+
+    collection = json.loads(output.read_text())['DATA_GROUP_COLLECTION']
+    # Both g1/c1 entries target the same key; the later one wins, as with update_output_file.
+    assert collection['g1']['c1'] == [{'NAME': 'alpha', 'SIZE': 25}, {'NAME': 'beta', 'SIZE': 5}]
+    assert collection['g2']['c1'] == [{'ID': KEYWORD, 'NAME': 'gamma', 'SIZE': 40}]
+
+    mtime = output.stat().st_mtime_ns
+    assert edt.process_batch(str(manifest), str(output), parser) == 3
+    assert output.stat().st_mtime_ns == mtime  # nothing changed, nothing rewritten
+
+
+def test_process_batch_appends_jsonl(tmp_path, parser, manifest):
+    output = tmp_path / 'out.jsonl'
+    edt.process_batch(str(manifest), str(output), parser)
+    edt.process_batch(str(manifest), str(output), parser)
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(lines) == 6
+    assert lines[0] == {'data_group': 'g1', 'category': 'c1', 'data': [{'NAME': 'alpha'}]}
+
+
+def test_process_batch_stops_on_unknown_output_format(tmp_path, parser, manifest, capsys):
+    output = tmp_path / 'out.txt'
+    output.write_text('not a known format\n')
+    assert edt.process_batch(str(manifest), str(output), parser) is None
+    assert 'Error detecting file format' in capsys.readouterr().out
+    assert output.read_text() == 'not a known format\n'
+
+
+@pytest.mark.parametrize('name, text', [('out.yaml', '---\n'), ('out.json', '[1, 2]\n')])
+def test_non_mapping_output_file_is_a_parse_error(tmp_path, parser, manifest, name, text):
+    output = tmp_path / name
+    output.write_text(text)
+    with pytest.raises(ValueError, match='Error reading or parsing'):
+        edt.process_batch(str(manifest), str(output), parser)
+    with pytest.raises(ValueError, match='Error reading or parsing'):
+        edt.update_output_file(str(output), [], parser, 'g1', 'c1')
@@ -0,0 +1,81 @@
+import itertools
+import random
+
+import pandas as pd
+import pytest
+
+import ExcelDataTransformer as edt
+
+openpyxl = pytest.importorskip('openpyxl')
+
+KEYWORD = 'HEADER_KEYWORD_TEXT'
+
+
+def _write_sheet(path, rows):
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    workbook.save(path)
+
+
+def _random_rows(seed):
+    rng = random.Random(seed)
+    rows = [['ID', 'A', 'B'], ['junk', 'text', None]]
+    for _ in range(rng.randint(2, 5)):
+        rows.append([KEYWORD, None if rng.random() < .5 else 'A', 'B'])
+        for i in range(rng.randint(0, 5)):
+            if rng.random() < .2:
+                rows.append([None, None, None])  # blank rows mid-sheet are table rows too
+            else:
+                rows.append([rng.choice(['x', 'y', None]), rng.choice([25, 5, 2.5, None]), f'b{i}'])
+    return rows
+
+
+def _load(path, start, end, windowed):
+    edt._load_excel_impl.cache_clear()
+    if not windowed:
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(edt, '_row_window', lambda *args: None)
+            return edt._load_excel_impl(str(path), 0, KEYWORD, start, end, None)
+    return edt._load_excel_impl(str(path), 0, KEYWORD, start, end, None)
+
+
+@pytest.fixture(autouse=True)
+def openpyxl_engine(monkeypatch):
+    monkeypatch.setattr(edt, 'CALAMINE_AVAILABLE', False)  # the row window is openpyxl-only
+    yield
+    edt._load_excel_impl.cache_clear()
+
+
+def test_window_keeps_full_read_types(tmp_path):
+    path = tmp_path / 'types.xlsx'
+    _write_sheet(path, [['ID', 'A'], ['junk', 'text'], [KEYWORD, None], ['x', 25], ['y', 5]])
+    windowed = _load(path, 0, 1, windowed=True)
+    assert windowed.to_dict('records') == [{'ID': KEYWORD, 'A': 25}]
+    assert type(windowed['A'].iloc[0]) is int
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_window_matches_full_read(tmp_path, seed):
+    path = tmp_path / f'tables{seed}.xlsx'
+    rows = _random_rows(seed)
+    _write_sheet(path, rows)
+    count = len(rows)
+    for start, end in itertools.product(range(count), range(count + 1)):
+        windowed = _load(path, start, end, windowed=True)
+        full = _load(path, start, end, windowed=False)
+        pd.testing.assert_frame_equal(windowed.reset_index(drop=True), full.reset_index(drop=True),
+                                      check_dtype=True, obj=f'rows {start}:{end}')
+
+
+def test_deferred_frame_behaves_like_the_loaded_frame(tmp_path):
+    path = tmp_path / 'lazy.xlsx'
+    _write_sheet(path, [['ID', 'A'], [KEYWORD, 'A'], ['x', 25], ['y', 5]])
+    parser = edt.ExcelDataTransformer(str(path))
+    parser.configure()
+    parser._load_excel()
+    assert list(parser.df) == ['ID', 'A']
+    assert repr(parser.df) == repr(parser.df.collect())
+    filtered = parser.filter_data('A', 'A > 10')
+    assert isinstance(filtered, pd.DataFrame)
+    assert filtered.to_dict('records') == [{'A': 25}]
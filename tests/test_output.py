@@ -0,0 +1,56 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ExcelDataTransformer as edt
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'NAME': ['a/b', None, 'ünï'],
+        'SIZE': [0.1234567890123456, np.nan, np.inf],
+        'COUNT': [1, 2, 3],
+        'WHEN': [pd.Timestamp('2024-01-02 03:04:05'), pd.NaT, pd.Timestamp(0)],
+    })
+
+
+@pytest.mark.parametrize('indent', [False, True])
+def test_json_fallback_matches_orjson(monkeypatch, indent):
+    pytest.importorskip('orjson')
+    records = edt._records(_frame())
+    expected = edt._json_bytes(records, indent=indent)
+    monkeypatch.setattr(edt, 'orjson', None)
+    assert edt._json_bytes(records, indent=indent) == expected
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_printed_json_matches_output_file(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(edt, 'orjson', None)
+    records = edt._records(_frame())
+    output_file = tmp_path / 'out.json'
+    edt.write_json_file(str(output_file), records)
+    printed = edt.ExcelDataTransformer().output_data(records, 'json')
+    assert printed == output_file.read_text(encoding='utf-8') + '\n'
+    assert 'NaN' not in printed and '\\/' not in printed
+    assert '0.1234567890123456' in printed
+
+
+def test_jsonl_lines_are_valid_json():
+    import json
+    printed = edt.ExcelDataTransformer().output_data(_frame(), 'jsonl')
+    rows = [json.loads(line) for line in printed.splitlines()]
+    assert [row['SIZE'] for row in rows] == [0.1234567890123456, None, None]
+
+
+def test_output_data_to_writes_bytes_to_utf8_buffer():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding='utf-8')
+    stream.write('before\n')
+    edt.ExcelDataTransformer().output_data_to(_frame(), stream, 'jsonl')
+    stream.flush()
+    assert raw.getvalue().decode('utf-8').startswith('before\n{"NAME":"a/b"')
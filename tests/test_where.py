@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ExcelDataTransformer as edt
+from ExcelDataTransformer import _where_mask
+
+CLAUSES = [
+    'NOTE != "a/b"',
+    'not NOTE == "a/b"',
+    'NOTE not in ["a/b"]',
+    'SIZE != 25',
+    'not SIZE > 10 and NOTE != "x"',
+]
+
+
+def _frame(arrow: bool) -> pd.DataFrame:
+    df = pd.DataFrame({
+        'NOTE': ['a/b', None, 'c', np.nan, 'a/b'],
+        'SIZE': [25, np.nan, 5, 40, np.nan],
+    })
+    if arrow:
+        pytest.importorskip('pyarrow')
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+    return df
+
+
+@pytest.mark.parametrize('arrow', [False, True], ids=['numpy', 'arrow'])
+@pytest.mark.parametrize('clause', CLAUSES)
+def test_where_mask_matches_eval_on_blanks(clause, arrow):
+    df = _frame(arrow)
+    engine = 'python' if arrow else None
+    expected = df.eval(clause, engine=engine).to_numpy(dtype=bool, na_value=False)
+    np.testing.assert_array_equal(_where_mask(df, clause), expected)
+
+
+@pytest.mark.parametrize('max_rows', [0, 50_000], ids=['eval', 'compiled'])
+def test_negations_keep_blank_rows(monkeypatch, max_rows):
+    monkeypatch.setattr(edt, 'COMPILED_WHERE_MAX_ROWS', max_rows)
+    df = _frame(arrow=False)
+    for clause in CLAUSES[:3]:
+        assert _where_mask(df, clause).tolist() == [False, True, True, True, False]
+
@@ -0,0 +1,63 @@
+import io
+import math
+import random
+
+import pytest
+
+import ExcelDataTransformer as edt
+
+yaml = pytest.importorskip('yaml')
+
+STRINGS = [
+    # reserved words and YAML indicators
+    'yes', 'No', 'ON', 'off', 'y', 'N', 'null', '~', 'true', '<<', '-', '?', '|', '>', '!x', '&a',
+    '*a', '%a', '@a', '`a', '{a}', '[a]', '#c', 'a #c', '- a', 'x: y', 'a,b', '=',
+    # numeric-looking strings
+    '1', '-5', '1.5', '1e5', 'e5', '.inf', '.nan', '0x1', '0o7', '12:30', '2024-01-01', '1_000',
+    # control, line-break and non-ASCII characters
+    'tab\t', 'nl\n', 'cr\r', '\x00', '\x07', '\x7f', '\x85', '\u2028', '\ufeff', '\xa0', 'h\xe9llo', '\U0001F600',
+    # plain strings and whitespace
+    '', ' ', ' a', 'a ', 'a b', 'a  b', 'abc/def', 'a.b-c', '_x', '"q"', "it's", '\\',
+]
+VALUES = STRINGS + [None, True, False, 0, -5, 10 ** 20, 0.1, 1.5, -0.0, 1e20, -1e-20, 1e16,
+                    float('nan'), float('inf'), -float('inf')]
+
+
+def _normalise(obj):
+    if isinstance(obj, float) and math.isnan(obj):
+        return 'NaN'  # NaN != NaN, compare a marker instead
+    if isinstance(obj, list):
+        return [_normalise(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _normalise(value) for key, value in obj.items()}
+    return obj
+
+
+def _fast_dump(records):
+    buffer = io.StringIO()
+    edt._fast_yaml_records(records, buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize('value', VALUES, ids=repr)
+def test_scalar_round_trips(value):
+    records = [{'key': value, 'other': 1}]
+    loaded = yaml.safe_load(_fast_dump(records))
+    assert _normalise(loaded) == _normalise(records)
+    assert type(loaded[0]['key']) is type(value)
+
+
+@pytest.mark.parametrize('key', STRINGS, ids=repr)
+def test_key_round_trips(key):
+    records = [{key: 'value'}]
+    assert yaml.safe_load(_fast_dump(records)) == records
+
+
+def test_matches_yaml_dump_on_random_records():
+    rng = random.Random(0)
+    for _ in range(500):
+        records = [{rng.choice(STRINGS): rng.choice(VALUES) for _ in range(rng.randint(0, 4))}
+                   for _ in range(rng.randint(0, 3))]
+        assert edt._is_flat_records(records)
+        expected = yaml.safe_load(yaml.dump(records, default_flow_style=False))
+        assert _normalise(yaml.safe_load(_fast_dump(records))) == _normalise(expected)